@@ -10,13 +10,39 @@ This module implements Registries for the AAS, in order to enable resolving glob
 """
 
 import abc
-from typing import MutableSet, Iterator, Generic, TypeVar, Dict, List, Optional, Iterable
+from typing import MutableSet, Iterator, Generic, TypeVar, Dict, List, Optional, Iterable, cast
 
 from aas_core3.types import Identifiable, Referable, Class
 
 _IdentifiableType = TypeVar('_IdentifiableType', bound=Identifiable)
 
 
+class _SubclassCache(Dict[type, bool]):
+    """
+    A cache whether types are subclasses of a given class, mapping type → bool
+
+    The abstract classes of aas-core3 make ``isinstance()`` go through :meth:`abc.ABCMeta.__instancecheck__`, which is
+    considerably slower than a dict lookup by ``type(obj)`` when it is done for every instance of an object tree.
+
+    Unlike ``isinstance()``, a lookup by ``type(obj)`` ignores an overridden ``__class__`` (as used by proxy objects),
+    and the result for a type is not updated if classes are registered with :meth:`abc.ABCMeta.register` after the
+    type has been looked up for the first time. Thus, it is only to be used for walking aas-core3 object trees.
+
+    :ivar cls: The class to check for
+    """
+
+    def __init__(self, cls: type) -> None:
+        super().__init__()
+        self.cls: type = cls
+
+    def __missing__(self, key: type) -> bool:
+        result = self[key] = issubclass(key, self.cls)
+        return result
+
+
+_IS_REFERABLE = _SubclassCache(Referable)
+
+
 class AbstractObjectProvider(metaclass=abc.ABCMeta):
     """
     Abstract baseclass for all objects, that allow to retrieve `Identifiable` objects
@@ -83,9 +109,14 @@ class ObjectStore(AbstractObjectStore[_IdentifiableType], Generic[_IdentifiableT
     """
 
     def __init__(self, objects: Iterable[_IdentifiableType] = ()) -> None:
-        self._backend: Dict[str, _IdentifiableType] = {}
-        for x in objects:
-            self.add(x)
+        items = list(objects)
+        self._backend: Dict[str, _IdentifiableType] = {x.id: x for x in items}
+        if len(self._backend) != len(items):
+            # Some ids occur more than once, which is only allowed for the very same object. Let add() sort this out
+            # and raise the appropriate KeyError.
+            self._backend.clear()
+            for x in items:
+                self.add(x)
 
     def _descend(self) -> Iterator["Class"]:
         """
@@ -96,11 +127,10 @@ class ObjectStore(AbstractObjectStore[_IdentifiableType], Generic[_IdentifiableT
 
         This method is not to be directly used.
         """
-        if self._backend is not None:
-            for identifiable in self._backend.values():
-                yield identifiable
+        for identifiable in self._backend.values():
+            yield identifiable
 
-                yield from identifiable.descend()
+            yield from identifiable.descend()
 
     def get_identifiable(self, identifier: str) -> _IdentifiableType:
         """
@@ -111,13 +141,30 @@ class ObjectStore(AbstractObjectStore[_IdentifiableType], Generic[_IdentifiableT
         """
         return self._backend[identifier]
 
+    def get(self, identifier: str, default: Optional[Identifiable] = None) -> Optional[Identifiable]:
+        """
+        Find an object in this set by its `Identifier`, with fallback parameter
+
+        Unlike :meth:`AbstractObjectProvider.get`, this looks the `Identifier` up in the backend directly, so that
+        misses do not raise and catch a `KeyError`. It does not call :meth:`get_identifiable`: Subclasses overriding
+        :meth:`get_identifiable` need to override this method as well, as it is also used by
+        :class:`~.ObjectProviderMultiplexer`.
+
+        :param identifier: `Identifier` of the object to return
+        :param default: An object to be returned, if no object with the given `Identifier` is found
+        :return: The `Identifiable` object with the given `Identifier` in the store. Otherwise, the ``default``
+                 object or None, if none is given.
+        """
+        return self._backend.get(identifier, default)
+
     def add(self, x: _IdentifiableType) -> None:
         """
         Add identifiable to the Objectstore
 
         :param x: Identifiable instance to add
         """
-        if x.id in self._backend and self._backend.get(x.id) is not x:
+        existing = self._backend.get(x.id)
+        if existing is not None and existing is not x:
             raise KeyError("Identifiable object with same id {} is already stored in this store"
                            .format(x.id))
         self._backend[x.id] = x
@@ -139,14 +186,10 @@ class ObjectStore(AbstractObjectStore[_IdentifiableType], Generic[_IdentifiableT
         :param id_short: Id_short of the referable
         :return: The `Referable` object
         """
-        referable: Referable
         identifiable = self.get_identifiable(identifier)
         for element in identifiable.descend():
-
-            if (
-                    isinstance(element, Referable) and id_short == element.id_short
-            ):
-                return element
+            if _IS_REFERABLE[type(element)] and id_short == cast(Referable, element).id_short:
+                return cast(Referable, element)
         raise KeyError("Referable object with short_id {} does not exist for identifiable object with id {}"
                        .format(id_short, identifier))
 
@@ -162,8 +205,8 @@ class ObjectStore(AbstractObjectStore[_IdentifiableType], Generic[_IdentifiableT
         referable = self.get_referable(identifier, id_short)
         children_referable: List[Referable] = []
         for element in referable.descend():
-            if isinstance(element, Referable):
-                children_referable.append(element)
+            if _IS_REFERABLE[type(element)]:
+                children_referable.append(cast(Referable, element))
         return children_referable
 
     def get_parent_referable(self, id_short: str) -> Referable:
@@ -174,11 +217,11 @@ class ObjectStore(AbstractObjectStore[_IdentifiableType], Generic[_IdentifiableT
         :return: The `Referable` parent object
         """
         for element in self._descend():
-            if isinstance(element, Referable):
+            if _IS_REFERABLE[type(element)]:
                 children_referables = element.descend_once()
                 for referable in children_referables:
-                    if isinstance(referable, Referable) and referable.id_short == id_short:
-                        return element
+                    if _IS_REFERABLE[type(referable)] and cast(Referable, referable).id_short == id_short:
+                        return cast(Referable, element)
         raise KeyError("there is no parent Identifiable for id_short {}".format(id_short))
 
     def __contains__(self, x: object) -> bool:
@@ -212,9 +255,8 @@ class ObjectProviderMultiplexer(AbstractObjectProvider):
 
     def get_identifiable(self, identifier: str) -> Identifiable:
         for provider in self.providers:
-            try:
-                return provider.get_identifiable(identifier)
-            except KeyError:
-                pass
+            identifiable = provider.get(identifier)
+            if identifiable is not None:
+                return identifiable
         raise KeyError("Identifier could not be found in any of the {} consulted registries."
                        .format(len(self.providers)))
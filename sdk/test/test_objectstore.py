@@ -13,15 +13,26 @@ import aas_core3.types as aas_types
 
 
 class ProvidersTest(unittest.TestCase):
-    def setUp(self) -> None:
-        self.aas1 = AssetAdministrationShell(id="urn:x-test:aas1",
-                                             asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
-
-        self.aas2 = AssetAdministrationShell(id="urn:x-test:aas2",
-                                             asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
-
-        self.aas3 = AssetAdministrationShell(id="urn:x-test:aas3",
-                                             asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
+    aas1: AssetAdministrationShell
+    aas2: AssetAdministrationShell
+    aas3: AssetAdministrationShell
+    list_element: aas_types.Blob
+    another_list_element: aas_types.Blob
+    element_list: aas_types.SubmodelElementList
+    submodel1: aas_types.Submodel
+    submodel2: aas_types.Submodel
+    submodel_store: ObjectStore[Identifiable]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.aas1 = AssetAdministrationShell(id="urn:x-test:aas1",
+                                            asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
+
+        cls.aas2 = AssetAdministrationShell(id="urn:x-test:aas2",
+                                            asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
+
+        cls.aas3 = AssetAdministrationShell(id="urn:x-test:aas3",
+                                            asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
 
         some_element = aas_types.Property(
             id_short="some_property",
@@ -35,44 +46,46 @@ class ProvidersTest(unittest.TestCase):
             value=b'\xDE\xAD\xBE\xEF'
         )
 
-        self.list_element = aas_types.Blob(
+        cls.list_element = aas_types.Blob(
             id_short="list_1",
             content_type="application/octet-stream",
             value=b'\xDE\xAD\xBE\xEF'
         )
 
-        self.another_list_element = aas_types.Blob(
+        cls.another_list_element = aas_types.Blob(
             id_short="list_2",
             content_type="application/octet-stream",
             value=b'\xDE\xAD\xBE\xEF'
         )
 
-        self.element_list = aas_types.SubmodelElementList(id_short='ExampleSubmodelList',
-                                                          type_value_list_element=aas_types.AASSubmodelElements.
-                                                          SUBMODEL_ELEMENT_LIST,
-                                                          value=[self.list_element, self.another_list_element])
+        cls.element_list = aas_types.SubmodelElementList(id_short='ExampleSubmodelList',
+                                                         type_value_list_element=aas_types.AASSubmodelElements.
+                                                         SUBMODEL_ELEMENT_LIST,
+                                                         value=[cls.list_element, cls.another_list_element])
 
-        self.submodel1 = aas_types.Submodel(
+        cls.submodel1 = aas_types.Submodel(
             id="urn:x-test:submodel1",
             submodel_elements=[
                 some_element,
                 another_element,
-                self.element_list
+                cls.element_list
             ]
         )
-        self.submodel2 = aas_types.Submodel(
+        cls.submodel2 = aas_types.Submodel(
             id="urn:x-test:submodel2",
             submodel_elements=[
                 some_element
             ]
         )
+        # Shared by all tests, which only read from the store
+        cls.submodel_store = ObjectStore([cls.submodel1, cls.submodel2])
 
     def test_store_retrieve(self) -> None:
         object_store: ObjectStore[Identifiable] = ObjectStore()
         object_store.add(self.aas1)
         object_store.add(self.aas2)
-        self.assertIn(self.aas1, object_store)
-        self.assertFalse(self.aas3 in object_store)
+        self.assertIs(self.aas1, object_store.get(self.aas1.id))
+        self.assertIsNone(object_store.get(self.aas3.id))
         aas3 = AssetAdministrationShell(id="urn:x-test:aas1", asset_information=AssetInformation(
             global_asset_id="http://acplt.org/TestAsset/", asset_kind=AssetKind.NOT_APPLICABLE))
         with self.assertRaises(KeyError) as cm:
@@ -89,10 +102,39 @@ class ProvidersTest(unittest.TestCase):
         with self.assertRaises(KeyError) as cm:
             object_store.get_identifiable("urn:x-test:aas1")
         self.assertIsNone(object_store.get("urn:x-test:aas1"))
+        self.assertIs(self.aas3, object_store.get("urn:x-test:aas1", self.aas3))
+        self.assertIs(self.aas2, object_store.get("urn:x-test:aas2", self.aas3))
         self.assertEqual("'urn:x-test:aas1'", str(cm.exception))
         self.assertIs(self.aas2, object_store.pop())
         self.assertEqual(0, len(object_store))
 
+    def test_store_init(self) -> None:
+        object_store: ObjectStore[Identifiable] = ObjectStore([self.aas1, self.aas2, self.aas1])
+        self.assertEqual(2, len(object_store))
+        self.assertIs(self.aas1, object_store.get_identifiable("urn:x-test:aas1"))
+        aas3 = AssetAdministrationShell(id="urn:x-test:aas1",
+                                        asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
+        with self.assertRaises(KeyError) as cm:
+            ObjectStore([self.aas1, aas3])
+        self.assertEqual("'Identifiable object with same id urn:x-test:aas1 is already "
+                         "stored in this store'", str(cm.exception))
+
+    def test_store_contains_proxy(self) -> None:
+        # Stands in for the proxy objects of remote Identifiables, which AbstractObjectProvider allows database and
+        # AAS API client providers to return: they pretend to be of the proxied class via ``__class__``.
+        class Proxy:
+            id = "urn:x-test:aas1"
+
+            @property  # type: ignore[misc]
+            def __class__(self) -> type:
+                return AssetAdministrationShell
+
+        proxy = Proxy()
+        object_store: ObjectStore[Identifiable] = ObjectStore()
+        object_store.add(proxy)  # type: ignore[arg-type]
+        self.assertIn(proxy, object_store)
+        self.assertNotIn(self.aas1, object_store)
+
     def test_store_update(self) -> None:
         object_store1: ObjectStore[Identifiable] = ObjectStore()
         object_store1.add(self.aas1)
@@ -100,7 +142,18 @@ class ProvidersTest(unittest.TestCase):
         object_store2.add(self.aas2)
         object_store1.update(object_store2)
         self.assertIsInstance(object_store1, ObjectStore)
-        self.assertIn(self.aas2, object_store1)
+        self.assertIs(self.aas2, object_store1.get(self.aas2.id))
+
+    def test_store_contains(self) -> None:
+        object_store: ObjectStore[Identifiable] = ObjectStore([self.aas1])
+        self.assertIn(self.aas1, object_store)
+        self.assertIn("urn:x-test:aas1", object_store)
+        self.assertNotIn(self.aas2, object_store)
+        self.assertNotIn("urn:x-test:aas2", object_store)
+        aas1_copy = AssetAdministrationShell(id="urn:x-test:aas1",
+                                             asset_information=AssetInformation(asset_kind=AssetKind.TYPE))
+        self.assertNotIn(aas1_copy, object_store)
+        self.assertNotIn(self.list_element, object_store)
 
     def test_provider_multiplexer(self) -> None:
         aas_object_store: ObjectStore[Identifiable] = ObjectStore()
@@ -119,15 +172,59 @@ class ProvidersTest(unittest.TestCase):
                          str(cm.exception))
 
     def test_get_children_referable(self) -> None:
-        object_store: ObjectStore[Identifiable] = ObjectStore()
-        object_store.add(self.submodel1)
-        children = object_store.get_children_referable("urn:x-test:submodel1", 'ExampleSubmodelList')
-        assert self.list_element in children
-        assert self.another_list_element in children
+        children = self.submodel_store.get_children_referable("urn:x-test:submodel1", 'ExampleSubmodelList')
+        self.assertIn(self.list_element, children)
+        self.assertIn(self.another_list_element, children)
 
     def test_get_parent_identifiable(self) -> None:
+        parent_referable = self.submodel_store.get_parent_referable("list_1")
+        self.assertIs(self.element_list, parent_referable)
+
+    def test_get_referable(self) -> None:
+        self.assertIs(self.list_element, self.submodel_store.get_referable("urn:x-test:submodel1", "list_1"))
+        self.assertIs(self.element_list,
+                      self.submodel_store.get_referable("urn:x-test:submodel1", "ExampleSubmodelList"))
+        with self.assertRaises(KeyError) as cm:
+            self.submodel_store.get_referable("urn:x-test:submodel2", "list_1")
+        self.assertEqual("'Referable object with short_id list_1 does not exist for identifiable object with id "
+                         "urn:x-test:submodel2'", str(cm.exception))
+
+    def test_get_referable_modified(self) -> None:
+        old_element = aas_types.Property(id_short="old_property", value_type=aas_types.DataTypeDefXSD.INT)
+        submodel = aas_types.Submodel(id="urn:x-test:submodel3", submodel_elements=[old_element])
         object_store: ObjectStore[Identifiable] = ObjectStore()
-        object_store.add(self.submodel1)
-        object_store.add(self.submodel2)
-        parent_referable = object_store.get_parent_referable("list_1")
-        assert parent_referable == self.element_list
+        object_store.add(submodel)
+        self.assertIs(old_element, object_store.get_referable("urn:x-test:submodel3", "old_property"))
+        self.assertIs(submodel, object_store.get_parent_referable("old_property"))
+        new_element = aas_types.Property(id_short="new_property", value_type=aas_types.DataTypeDefXSD.INT)
+        submodel.submodel_elements = [new_element]
+        self.assertIs(new_element, object_store.get_referable("urn:x-test:submodel3", "new_property"))
+        self.assertIs(submodel, object_store.get_parent_referable("new_property"))
+        with self.assertRaises(KeyError):
+            object_store.get_referable("urn:x-test:submodel3", "old_property")
+        with self.assertRaises(KeyError):
+            object_store.get_parent_referable("old_property")
+        new_element.id_short = "renamed_property"
+        self.assertIs(new_element, object_store.get_referable("urn:x-test:submodel3", "renamed_property"))
+        with self.assertRaises(KeyError):
+            object_store.get_referable("urn:x-test:submodel3", "new_property")
+        with self.assertRaises(KeyError):
+            object_store.get_parent_referable("new_property")
+        # An element added to an earlier Identifiable takes precedence over matches in later ones
+        other_submodel = aas_types.Submodel(id="urn:x-test:submodel4", submodel_elements=[
+            aas_types.Property(id_short="other_property", value_type=aas_types.DataTypeDefXSD.INT)])
+        object_store.add(other_submodel)
+        self.assertIs(other_submodel, object_store.get_parent_referable("other_property"))
+        submodel.submodel_elements.append(
+            aas_types.Property(id_short="other_property", value_type=aas_types.DataTypeDefXSD.INT))
+        self.assertIs(submodel, object_store.get_parent_referable("other_property"))
+
+    def test_get_parent_referable_nested(self) -> None:
+        # id_shorts are only unique within their namespace, so the same id_short may occur on several levels
+        inner_property = aas_types.Property(id_short="x", value_type=aas_types.DataTypeDefXSD.INT)
+        collection = aas_types.SubmodelElementCollection(id_short="collection", value=[inner_property])
+        outer_property = aas_types.Property(id_short="x", value_type=aas_types.DataTypeDefXSD.INT)
+        submodel = aas_types.Submodel(id="urn:x-test:submodel3", submodel_elements=[collection, outer_property])
+        object_store: ObjectStore[Identifiable] = ObjectStore([submodel])
+        self.assertIs(submodel, object_store.get_parent_referable("x"))
+        self.assertIs(inner_property, object_store.get_referable("urn:x-test:submodel3", "x"))